@@ -1,9 +1,14 @@
 import numpy as np
 import pygame
 import json
-import random
 import os
+from collections import OrderedDict
 
+from mapgen import TILE_TYPE_NAMES, generate_layered_map, generate_interior_map, place_buildings_on_map
+
+
+MAP_BACKGROUND_COLOR = (114, 199, 160)
+MAP_CHUNK_TILES = 16 # Maps are rendered in square chunks of this many tiles per side
 
 
 #Camera Class
@@ -40,252 +45,51 @@ class Camera:
         return x - self.camera_x, y - self.camera_y
 
 
-class BiomeType:
-    LAKE = "lake"
-    FOREST = "forest"
-    PATH = "path" 
-    TALLGRASS = "tallgrass" 
-    FLOWERS = "flowers"     
-
-
-#Map Gen
-def generate_layered_map(rows, cols, map_settings, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-        random.seed(seed)
-
-    SUPER_GRID_REGION_SIZE = map_settings["super_grid_region_size"]
-    max_path_percentage = map_settings["max_path_percentage"]
-    max_attempts = map_settings["max_map_generation_attempts"]
-    tallgrass_probability = map_settings["tallgrass_probability"]
-    flowers_probability = map_settings["flowers_probability"]
-
-    # Calculate supergrid dimensions
-    super_rows = rows // SUPER_GRID_REGION_SIZE
-    super_cols = cols // SUPER_GRID_REGION_SIZE
-
-    if super_rows == 0 or super_cols == 0:
-        print("Error: Map dimensions too small for super-grid size.")
-        return None, None
-
-    # Initialize supergrid with paths by default
-    super_grid = np.full((super_rows, super_cols), BiomeType.PATH, dtype=object)
-    zone_types = [BiomeType.LAKE, BiomeType.FOREST]
-    
-    attempts = 0
-
-    while attempts < max_attempts:
-        current_super_grid = np.full((super_rows, super_cols), BiomeType.PATH, dtype=object)
-        
-        # More zones for for nonpath areas
-        num_zones_to_create = random.randint(5, 12)
-        for _ in range(num_zones_to_create):
-            start_r = random.randint(0, super_rows - 1)
-            start_c = random.randint(0, super_cols - 1)
-            zone_type = random.choice(zone_types)
-            
-           
-            blob_size = random.randint(10, 35)
-
-            q = [(start_r, start_c)] 
-            visited = set()
-            count = 0
-
-            while q and count < blob_size:
-                r, c = q.pop(0)
-
-                if (r, c) in visited:
-                    continue
-                visited.add((r, c))
-
-                if 0 <= r < super_rows and 0 <= c < super_cols:
-                    current_super_grid[r, c] = zone_type
-                    count += 1
-
-                    
-                    if random.random() < 0.8:
-                        neighbors = []
-                        if r > 0: neighbors.append((r - 1, c))
-                        if r < super_rows - 1: neighbors.append((r + 1, c))
-                        if c > 0: neighbors.append((r, c - 1))
-                        if c < super_cols - 1: neighbors.append((r, c + 1))
-                        random.shuffle(neighbors) 
-                        q.extend(neighbors)
-            
-        path_cells = np.sum(current_super_grid == BiomeType.PATH)
-        current_path_percentage = path_cells / (super_rows * super_cols)
-
-        # Check if the current path percentage is within the allowed limit
-        if current_path_percentage <= max_path_percentage:
-            super_grid = current_super_grid
-            break
-        attempts += 1
-    
-    if attempts == max_attempts:
-        print(f"Couldn't generate map with the current path percentage")
-    else:
-        print(f"Map generation successful after {attempts} attempts.")
-
-
-    # Translate supergrid to tile level coordinate grid
-    coordinate_grid = np.zeros((rows, cols), dtype=int)
-    tile_map = np.empty((rows, cols), dtype=object)
-
-
-    for super_r in range(super_rows):
-        for super_c in range(super_cols):
-            zone_type = super_grid[super_r, super_c]
-
-
-            start_tile_r = super_r * SUPER_GRID_REGION_SIZE
-            start_tile_c = super_c * SUPER_GRID_REGION_SIZE
+# Facing directions as list indices into the player's animation frames
+class Direction:
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
 
+# Image file prefix of every Direction id, in id order
+DIRECTION_NAMES = ("up", "down", "left", "right")
 
-            for r in range(start_tile_r, start_tile_r + SUPER_GRID_REGION_SIZE):
-                for c in range(start_tile_c, start_tile_c + SUPER_GRID_REGION_SIZE):
-                    if zone_type == BiomeType.LAKE:
-                        coordinate_grid[r, c] = 0 #0 for impassable
-                        tile_map[r, c] = "water"
-                    elif zone_type == BiomeType.FOREST:
-                        coordinate_grid[r, c] = 0 #0 for impassable
-                        tile_map[r, c] = "forest_tree"
-                    else: # BiomeType.PATH
-                        coordinate_grid[r, c] = 1 #1 for walkable
-                        tile_map[r, c] = "grassland"
-
-
-    for r in range(rows):
-        for c in range(cols):
-            if coordinate_grid[r, c] == 1: 
-                if random.random() < tallgrass_probability:
-                    tile_map[r, c] = "tallgrass"
-                elif random.random() < flowers_probability: 
-                    tile_map[r, c] = "flowers"
-
-
-    return coordinate_grid, tile_map
-
-
-def generate_interior_map(rows, cols, interior_settings):
-    coordinate_grid = np.zeros((rows, cols), dtype=int)
-    tile_map = np.empty((rows, cols), dtype=object)
-
-    floor_tile_type = interior_settings["floor_tile_type"]
-    wall_tile_type = interior_settings["wall_tile_type"]
-    door_tile_type = interior_settings["door_tile_type"]
-
-
-    tile_map.fill(floor_tile_type)
-    coordinate_grid.fill(1) 
-
-    # Create walls around the perimeter
-    for r in range(rows):
-        for c in range(cols):
-            if r == 0 or r == rows - 1 or c == 0 or c == cols - 1:
-                tile_map[r, c] = wall_tile_type
-                coordinate_grid[r, c] = 0 #Walls are impassable
-
-    # Place a door in the middle of the bottom wall
-    door_col = cols // 2
-    #door is on the bottom wall and in bounds
-    if rows - 1 >= 0 and 0 <= door_col < cols:
-        tile_map[rows - 1, door_col] = door_tile_type
-        coordinate_grid[rows - 1, door_col] = 1 
-
-    print(f"Interior map generated: {rows}x{cols} with door at ({rows-1}, {door_col})")
-    return coordinate_grid, tile_map, (rows - 1, door_col)
-
-
-def place_buildings_on_map(coordinate_grid, num_buildings, building_definitions):
-    rows, cols = coordinate_grid.shape
-    placed_buildings_objects = []
-
-    # Collect all possible top-left starting points (must be a path tile)
-    possible_top_lefts = []
-    for r in range(rows):
-        for c in range(cols):
-            if coordinate_grid[r, c] == 1:
-                possible_top_lefts.append((r, c))
-    
-    random.shuffle(possible_top_lefts) 
-
-    building_types = list(building_definitions.keys())
-
-    for r_start, c_start in possible_top_lefts:
-        if len(placed_buildings_objects) >= num_buildings:
-            break 
-
-        building_type_name = random.choice(building_types)
-        building_info = building_definitions[building_type_name]
-        
-        b_width = building_info["width_tiles"]
-        b_height = building_info["height_tiles"]
-        
-        # Check if building fits within map boundaries
-        if r_start + b_height > rows or c_start + b_width > cols:
-            continue
-
-        is_clear = True
-        # Check if all tiles under the building are clear and are path tiles
-        for r_offset in range(b_height):
-            for c_offset in range(b_width):
-                current_r = r_start + r_offset
-                current_c = c_start + c_offset
-                
-                # Building can only be placed on path tiles
-                if not (0 <= current_r < rows and 0 <= current_c < cols and coordinate_grid[current_r, current_c] == 1):
-                    is_clear = False
-                    break
-            if not is_clear:
-                break
-        
-
-        interaction_tile_x = c_start + b_width // 2
-        interaction_tile_y = r_start + b_height 
-
-
-        if not (0 <= interaction_tile_y < rows and 0 <= interaction_tile_x < cols and coordinate_grid[interaction_tile_y, interaction_tile_x] == 1):
-            is_clear = False
-
-        if is_clear:
-            # Mark the tiles occupied by the building as impassable (2)
-            for r_offset in range(b_height):
-                for c_offset in range(b_width):
-                    coordinate_grid[r_start + r_offset, c_start + c_offset] = 2
-            
-            coordinate_grid[interaction_tile_y, interaction_tile_x] = 1 
-
-            placed_buildings_objects.append({
-                "type": building_type_name,
-                "grid_x": c_start,
-                "grid_y": r_start,
-                "width_tiles": b_width,
-                "height_tiles": b_height,
-                "entrance_tile_world_coords": (interaction_tile_x, interaction_tile_y) #The player stands on this tile to interact
-            })
-            
-    return placed_buildings_objects
+# Facing direction for each (dx, dy) movement step
+DIRECTION_FROM_STEP = {
+    (0, -1): Direction.UP,
+    (0, 1): Direction.DOWN,
+    (-1, 0): Direction.LEFT,
+    (1, 0): Direction.RIGHT
+}
 
 
 #Player Class 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, start_grid_x, start_grid_y, square_width, square_height, total_rows, total_cols, player_images, game_settings):
+    # Fixed attribute set: slot access skips the instance dict on the per-frame update/move path
+    __slots__ = (
+        "images", "direction", "_frames", "_n_frames", "current_frame", "animation_timer", "animation_speed",
+        "image", "rect", "grid_x", "grid_y", "coordinate_grid", "total_rows", "total_cols",
+        "square_width", "square_height", "move_cooldown_initial", "move_cooldown_subsequent",
+        "move_timer", "moving_direction", "interaction_cooldown", "max_interaction_cooldown"
+    )
+
+    def __init__(self, start_grid_x, start_grid_y, square_width, square_height, coordinate_grid, player_images, game_settings):
         super().__init__()
 
         self.images = player_images
-        self.direction = "down"
+        self.set_direction(Direction.DOWN)
         self.current_frame = 0
         self.animation_timer = 0
         self.animation_speed = game_settings["player_animation_speed"]
 
-        self.image = self.images[self.direction][self.current_frame]
+        self.image = self._frames[self.current_frame]
         self.rect = self.image.get_rect(topleft=(start_grid_x * square_width, start_grid_y * square_height))
 
         self.grid_x = start_grid_x
         self.grid_y = start_grid_y
 
-        self.total_rows = total_rows
-        self.total_cols = total_cols
+        self.set_map(coordinate_grid)
         self.square_width = square_width
         self.square_height = square_height
 
@@ -297,7 +101,23 @@ class Player(pygame.sprite.Sprite):
         self.interaction_cooldown = 0 
         self.max_interaction_cooldown = 20 
 
-    def update(self, coordinate_grid):
+    def set_map(self, coordinate_grid):
+        """
+        Points the player at the walkability grid of the map they are on.
+        Map dimensions are cached here so moves don't have to look them up.
+        """
+        self.coordinate_grid = coordinate_grid
+        self.total_rows, self.total_cols = coordinate_grid.shape
+
+    def set_direction(self, direction):
+        """
+        Turns the player to face direction, keeping that direction's animation frames at hand.
+        """
+        self.direction = direction
+        self._frames = self.images[direction]
+        self._n_frames = len(self._frames)
+
+    def update(self):
         if self.move_timer > 0:
             self.move_timer -= 1
         if self.interaction_cooldown > 0:
@@ -306,32 +126,26 @@ class Player(pygame.sprite.Sprite):
         if self.moving_direction:
             moved = False
             if self.move_timer == 0:
-                moved = self.try_move(*self.moving_direction, coordinate_grid, self.total_rows, self.total_cols, is_continuous=True)
+                moved = self.try_move(*self.moving_direction, is_continuous=True)
             self.update_animation()
         else:
             self.animation_timer = 0
             self.current_frame = 0
-            self.image = self.images[self.direction][self.current_frame]
+            self.image = self._frames[0]
 
     def update_animation(self):
         self.animation_timer += 1
         if self.animation_timer >= self.animation_speed:
-            self.current_frame = (self.current_frame + 1) % len(self.images[self.direction])
-            self.image = self.images[self.direction][self.current_frame]
+            self.current_frame = (self.current_frame + 1) % self._n_frames
+            self.image = self._frames[self.current_frame]
             self.animation_timer = 0
 
     def set_moving_direction(self, dx, dy):
-        direction_map = {
-            (0, -1): "up",
-            (0, 1): "down",
-            (-1, 0): "left",
-            (1, 0): "right"
-        }
-        new_direction = direction_map.get((dx, dy), "down")
+        new_direction = DIRECTION_FROM_STEP.get((dx, dy), Direction.DOWN)
 
         if self.moving_direction != (dx, dy):
             self.moving_direction = (dx, dy)
-            self.direction = new_direction
+            self.set_direction(new_direction)
             self.move_timer = self.move_cooldown_initial
 
 
@@ -340,7 +154,7 @@ class Player(pygame.sprite.Sprite):
         self.move_timer = 0
 
 
-    def try_move(self, dx, dy, coordinate_grid, map_rows, map_cols, is_continuous=False):
+    def try_move(self, dx, dy, is_continuous=False):
         if is_continuous and self.move_timer > 0:
             return False
 
@@ -348,16 +162,16 @@ class Player(pygame.sprite.Sprite):
         new_grid_y = self.grid_y + dy
 
         #Check map bounds
-        if not (0 <= new_grid_x < map_cols and 0 <= new_grid_y < map_rows):
+        if not (0 <= new_grid_x < self.total_cols and 0 <= new_grid_y < self.total_rows):
             return False
             
         #Player can only move on walkable tiles
-        if coordinate_grid[new_grid_y, new_grid_x] != 1:
+        if self.coordinate_grid[new_grid_y, new_grid_x] != 1:
             return False
 
         self.grid_x = new_grid_x
         self.grid_y = new_grid_y
-        self.rect.topleft = (self.grid_x * self.square_width, self.grid_y * self.square_height)
+        self.rect.topleft = (new_grid_x * self.square_width, new_grid_y * self.square_height)
         self.move_timer = self.move_cooldown_subsequent if is_continuous else self.move_cooldown_initial
         return True
 
@@ -384,9 +198,8 @@ def switch_to_outdoor():
     player.grid_x = return_coords[0]
     player.grid_y = return_coords[1]
     
-    # Update player's internal map dimensions
-    player.total_rows = current_map_data["grid"].shape[0]
-    player.total_cols = current_map_data["grid"].shape[1]
+    # Update player's internal map grid and dimensions
+    player.set_map(current_map_data["grid"])
 
     camera = Camera(current_map_data["screen_width"], current_map_data["screen_height"], 
                     current_map_data["grid"].shape[1], current_map_data["grid"].shape[0], 
@@ -405,7 +218,7 @@ def switch_to_indoor(outdoor_entrance_coords, interior_settings, game_settings):
     global player, camera, current_map_data, outdoor_map_data
 
     # Store current outdoor map state before switching
-    outdoor_map_data['map_details'] = current_map_data.copy() 
+    outdoor_map_data['map_details'] = current_map_data
     outdoor_map_data['player_last_outdoor_pos'] = outdoor_entrance_coords # Store where we entered from
     outdoor_map_data['buildings'] = placed_buildings_data # Reference to the global list of buildings
 
@@ -429,9 +242,8 @@ def switch_to_indoor(outdoor_entrance_coords, interior_settings, game_settings):
     player.grid_x = interior_door_pos[1] 
     player.grid_y = interior_door_pos[0] - 1
 
-    # Update player's internal map dimensions
-    player.total_rows = current_map_data["grid"].shape[0]
-    player.total_cols = current_map_data["grid"].shape[1]
+    # Update player's internal map grid and dimensions
+    player.set_map(current_map_data["grid"])
 
     camera = Camera(current_map_data["screen_width"], current_map_data["screen_height"], 
                     current_map_data["grid"].shape[1], current_map_data["grid"].shape[0], 
@@ -446,6 +258,122 @@ def switch_to_indoor(outdoor_entrance_coords, interior_settings, game_settings):
     print(f"Switched to indoor map. Player at {player.grid_x},{player.grid_y}")
 
 
+# Loaded images by path, and scaled copies by (path, size)
+_IMAGE_CACHE = {}
+_SCALED_IMAGE_CACHE = {}
+
+def load_image(path, size=None):
+    """
+    Loads an image with per-pixel alpha, optionally scaled to size, reusing earlier loads of the same file.
+    Raises pygame.error if the file can't be loaded.
+    """
+    key = (path, size)
+    image = _SCALED_IMAGE_CACHE.get(key)
+    if image is None:
+        image = _IMAGE_CACHE.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert_alpha()
+            _IMAGE_CACHE[path] = image
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        _SCALED_IMAGE_CACHE[key] = image
+    return image
+
+
+def render_map_surface(tile_map, tile_textures, tile_size, static_sprites=(), origin=(0, 0)):
+    """
+    Composites every tile of a (part of a) map, and any static (surface, rect) sprites on top, onto a single surface.
+    origin is the map pixel position of the surface's top-left corner; sprite rects are in map pixels.
+    """
+    rows, cols = tile_map.shape
+    map_surface = pygame.Surface((cols * tile_size, rows * tile_size)).convert()
+    map_surface.fill(MAP_BACKGROUND_COLOR)
+
+    # Blits are grouped by tile type so the same texture is repeated back to back.
+    # Tiles never overlap, so the order they are drawn in does not matter
+    tile_blits = []
+    for tile_id, texture in enumerate(tile_textures):
+        tile_rows, tile_cols = np.nonzero(tile_map == tile_id)
+        tile_blits.extend((texture, dest) for dest in zip((tile_cols * tile_size).tolist(), (tile_rows * tile_size).tolist()))
+
+    # pygame-ce's fblits() runs the whole sequence in C without building a list of result rects
+    if hasattr(map_surface, "fblits"):
+        map_surface.fblits(tile_blits)
+    else:
+        map_surface.blits(tile_blits, doreturn=False)
+
+    origin_x, origin_y = origin
+    surface_rect = map_surface.get_rect(topleft=origin)
+    map_surface.blits([(sprite, sprite_rect.move(-origin_x, -origin_y))
+                       for sprite, sprite_rect in static_sprites if surface_rect.colliderect(sprite_rect)], doreturn=False)
+    return map_surface
+
+
+class ChunkedMapSurface:
+    """
+    A map's pixels, rendered lazily in chunks of tiles the first time they are needed.
+    Only the most recently used chunks are kept, so memory stays bounded however large the map is.
+    view_size is the (width, height) in pixels of the largest area copied out at once, normally the screen.
+    """
+    def __init__(self, tile_map, tile_textures, tile_size, view_size, static_sprites=()):
+        self.tile_map = tile_map
+        self.tile_textures = tile_textures
+        self.tile_size = tile_size
+        self.static_sprites = static_sprites
+        self.chunk_pixels = MAP_CHUNK_TILES * tile_size
+
+        # An unaligned view touches up to ceil(size / chunk) + 1 chunks per axis.
+        # One more ring around that keeps chunks just scrolled past from being rendered again
+        view_width, view_height = view_size
+        self.max_chunks = (-(-view_width // self.chunk_pixels) + 2) * (-(-view_height // self.chunk_pixels) + 2)
+
+        rows, cols = tile_map.shape
+        self.rect = pygame.Rect(0, 0, cols * tile_size, rows * tile_size)
+        self.chunks = OrderedDict() # (chunk_row, chunk_col) -> Surface, least recently used first
+
+    def get_width(self):
+        return self.rect.width
+
+    def get_height(self):
+        return self.rect.height
+
+    def get_chunk(self, chunk_row, chunk_col):
+        key = (chunk_row, chunk_col)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        row_start = chunk_row * MAP_CHUNK_TILES
+        col_start = chunk_col * MAP_CHUNK_TILES
+        chunk = render_map_surface(self.tile_map[row_start:row_start + MAP_CHUNK_TILES, col_start:col_start + MAP_CHUNK_TILES],
+                                   self.tile_textures, self.tile_size, self.static_sprites,
+                                   (col_start * self.tile_size, row_start * self.tile_size))
+        self.chunks[key] = chunk
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def blit_area(self, dest, dest_pos, area):
+        """
+        Copies the map pixels inside area (a Rect in map pixels) to dest, with area's top-left landing on dest_pos.
+        Like Surface.blit, parts of area outside the map are skipped.
+        """
+        visible = area.clip(self.rect)
+        if not visible:
+            return
+
+        offset_x = dest_pos[0] - area.x
+        offset_y = dest_pos[1] - area.y
+        chunk_pixels = self.chunk_pixels
+        for chunk_row in range(visible.top // chunk_pixels, (visible.bottom - 1) // chunk_pixels + 1):
+            for chunk_col in range(visible.left // chunk_pixels, (visible.right - 1) // chunk_pixels + 1):
+                chunk_rect = pygame.Rect(chunk_col * chunk_pixels, chunk_row * chunk_pixels, chunk_pixels, chunk_pixels)
+                part = visible.clip(chunk_rect)
+                dest.blit(self.get_chunk(chunk_row, chunk_col), (part.x + offset_x, part.y + offset_y),
+                          area=part.move(-chunk_rect.x, -chunk_rect.y))
+
+
 #Pygame Visualizer Main
 def run_pygame_visualizer():
     global player, camera, current_map_data, outdoor_map_data, placed_buildings_data
@@ -492,8 +420,10 @@ def run_pygame_visualizer():
 
 
     # Generate outdoor map-
-    outdoor_coordinate_grid, outdoor_tile_map = generate_layered_map(ARRAY_ROWS, ARRAY_COLS, map_settings, seed=SEED)
-    placed_buildings_data = place_buildings_on_map(outdoor_coordinate_grid, game_settings["num_buildings"], building_definitions)
+    # One seeded generator drives the whole outdoor map, terrain and buildings alike
+    rng = np.random.default_rng(SEED)
+    outdoor_coordinate_grid, outdoor_tile_map = generate_layered_map(ARRAY_ROWS, ARRAY_COLS, map_settings, rng)
+    placed_buildings_data = place_buildings_on_map(outdoor_coordinate_grid, game_settings["num_buildings"], building_definitions, rng)
 
 
     #Load + Scale all textures
@@ -513,93 +443,96 @@ def run_pygame_visualizer():
     for tile_type, path in image_paths.items():
         if tile_type not in ["player_base_path"]: 
             try:
-                texture_original = pygame.image.load(path).convert_alpha()
-                all_tile_textures[tile_type] = pygame.transform.scale(
-                    texture_original, (square_width, square_height)
-                )
+                texture_scaled = load_image(path, (square_width, square_height))
+                # Tiles are always drawn over the map background, so flatten any transparency onto it
+                # and keep an opaque surface in the display format (plain copy instead of alpha blending)
+                tile_surface = pygame.Surface((square_width, square_height)).convert()
+                tile_surface.fill(MAP_BACKGROUND_COLOR)
+                tile_surface.blit(texture_scaled, (0, 0))
+                all_tile_textures[tile_type] = tile_surface
             except pygame.error as e:
                 print(f"Error loading {path}: {e}. Using fallback color for {tile_type}.")
-                fallback_surface = pygame.Surface((square_width, square_height))
+                fallback_surface = pygame.Surface((square_width, square_height)).convert()
                 fallback_surface.fill(fallback_colors.get(tile_type, (255, 0, 255))) 
                 all_tile_textures[tile_type] = fallback_surface
     print("All tile textures loaded (or fallbacks created).")
 
+    # Drawn for any tile type that has no texture entry
+    missing_texture = pygame.Surface((square_width, square_height)).convert()
+    missing_texture.fill((255, 0, 255))
+
+    # Indexed by TileType id, matching the values stored in tile maps
+    tile_textures = [all_tile_textures.get(tile_type, missing_texture) for tile_type in TILE_TYPE_NAMES]
+
 
     # Load building sprites
+    # Every building type gets a surface here (image or fallback), so the game loop never has to draw placeholders itself
     building_images = {}
+    building_fallback_colors = {
+        "pokecenter": (150, 0, 150),
+        "bakery": (100, 100, 100)
+    }
     print("Loading building images...")
-    try:
-        for b_type, b_info in building_definitions.items():
-            building_sprite_original = pygame.image.load(b_info["file"]).convert_alpha()
-            scaled_sprite = pygame.transform.scale(
-                building_sprite_original,
-                (b_info["width_tiles"] * square_width, 
-                 b_info["height_tiles"] * square_height)
-            )
-            building_images[b_type] = scaled_sprite
-        print("Building images loaded successfully.")
-    except pygame.error as e:
-        print(f"Couldn't load building images from individual files: {e}. Using fallback colored rectangles for buildings.")
-        for b_type, b_info in building_definitions.items():
-            fallback_surface = pygame.Surface((b_info["width_tiles"] * square_width, b_info["height_tiles"] * square_height))
-            if b_type == "pokecenter":
-                fallback_surface.fill((150, 0, 150)) 
-            elif b_type == "bakery":
-                fallback_surface.fill((100, 100, 100)) 
+    for b_type, b_info in building_definitions.items():
+        building_size = (b_info["width_tiles"] * square_width, b_info["height_tiles"] * square_height)
+        try:
+            building_images[b_type] = load_image(b_info["file"], building_size)
+        except pygame.error as e:
+            print(f"Couldn't load building image {b_info['file']}: {e}. Using fallback colored rectangle for {b_type}.")
+            fallback_surface = pygame.Surface(building_size).convert()
+            fallback_surface.fill(building_fallback_colors.get(b_type, (255, 0, 255)))
             building_images[b_type] = fallback_surface
+    print("Building images loaded (or fallbacks created).")
+
+    # Sprite and world-pixel rect of every placed building, worked out once instead of every frame
+    building_sprites = [
+        (building_images[building_obj["type"]],
+         pygame.Rect(building_obj["grid_x"] * square_width, building_obj["grid_y"] * square_height,
+                     building_obj["width_tiles"] * square_width, building_obj["height_tiles"] * square_height))
+        for building_obj in placed_buildings_data
+    ]
 
 
     #Player Setup
     players = pygame.sprite.Group()
 
-    player_images = {}
-    directions = ["up", "down", "left", "right"]
+    player_images = [[] for _ in DIRECTION_NAMES] # Animation frames, indexed by Direction id
     player_base_path = image_paths["player_base_path"]
     print("Loading player images...")
-    for direction in directions:
-        player_images[direction] = []
+    for direction_id, direction in enumerate(DIRECTION_NAMES):
         for frame_num in [1, 2, 3, 4]: 
             try:
-                img = pygame.image.load(f"{player_base_path}{direction}{frame_num}.png").convert_alpha()
-                img = pygame.transform.scale(img, (TILE_SIZE, TILE_SIZE))
-                player_images[direction].append(img)
+                player_images[direction_id].append(load_image(f"{player_base_path}{direction}{frame_num}.png", (TILE_SIZE, TILE_SIZE)))
             except pygame.error as e:
                 print(f"Missing image: {player_base_path}{direction}{frame_num}.png — using fallback")
-                fallback = pygame.Surface((TILE_SIZE, TILE_SIZE))
+                fallback = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
                 fallback.fill((255, 0, 0))  
-                player_images[direction].append(fallback)
+                player_images[direction_id].append(fallback)
     print("Player images loaded (or fallbacks created).")
                 
-    start_x, start_y = 0, 0
-    found_start = False
-    for r in range(ARRAY_ROWS):
-        for c in range(ARRAY_COLS):
-            if outdoor_coordinate_grid[r, c] == 1: 
-                start_x, start_y = c, r
-                found_start = True
-                break
-        if found_start:
-            break
-    
-    if not found_start:
+    # First walkable tile in row-major order
+    walkable_tiles = np.argwhere(outdoor_coordinate_grid == 1)
+    if len(walkable_tiles) == 0:
         print("Could not find a valid starting position for the player (no path tiles available). Exiting.")
         pygame.quit()
         return
+    start_y, start_x = walkable_tiles[0].tolist()
 
-    player = Player(start_x, start_y, square_width, square_height, ARRAY_ROWS, ARRAY_COLS, player_images, game_settings)
+    player = Player(start_x, start_y, square_width, square_height, outdoor_coordinate_grid, player_images, game_settings)
     players.add(player)
 
     current_map_data = {
         "grid": outdoor_coordinate_grid,
         "tiles": outdoor_tile_map,
         "type": "outdoor",
+        "entrances": {building_obj["entrance_tile_world_coords"]: building_obj for building_obj in placed_buildings_data}, # Entrance tile -> building, for O(1) lookups
         "tile_size": TILE_SIZE,
         "screen_width": SCREEN_WIDTH,
         "screen_height": SCREEN_HEIGHT
     }
     # Store outdoor map data for later use when coming from interior 
     outdoor_map_data = {
-        'map_details': current_map_data.copy(), 
+        'map_details': current_map_data,
         'player_last_outdoor_pos': (player.grid_x, player.grid_y), 
         'buildings': placed_buildings_data 
     }
@@ -608,99 +541,96 @@ def run_pygame_visualizer():
 
 
     #Main Game Loop
+    last_view = None # (map surface, camera x, camera y) shown on screen, used to tell when a full redraw is needed
+    last_player_draw_rect = None
+    last_player_image = None
+    interaction_key_latched = False # Up was used for a door and hasn't been released since, so it must not walk
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                # The window contents may have been lost, so the next draw repaints everything
+                last_view = None
             elif event.type == pygame.KEYDOWN:
-                interaction_happened = False
                 if event.key == pygame.K_UP and player.interaction_cooldown == 0:
+                    interaction_happened = False
                     if current_map_data["type"] == "outdoor":
-                        for building_obj in placed_buildings_data:
+                        building_obj = current_map_data["entrances"].get((player.grid_x, player.grid_y))
+                        if building_obj:
                             ent_x, ent_y = building_obj["entrance_tile_world_coords"]
-                            if player.grid_x == ent_x and player.grid_y == ent_y:
-                                print(f"Interacting with {building_obj['type']} at ({ent_x}, {ent_y}) to enter.")
-                                switch_to_indoor((ent_x, ent_y), interior_settings, game_settings)
-                                interaction_happened = True
-                                break
+                            print(f"Interacting with {building_obj['type']} at ({ent_x}, {ent_y}) to enter.")
+                            switch_to_indoor((ent_x, ent_y), interior_settings, game_settings)
+                            interaction_happened = True
                     elif current_map_data["type"] == "indoor":
                         exit_r, exit_c = current_map_data["exit_point"]
                         if player.grid_x == exit_c and player.grid_y == exit_r: 
                              print("Interacting to exit interior.")
                              switch_to_outdoor()
                              interaction_happened = True
-                             break
-            
-                if not interaction_happened:
-                    dx, dy = 0, 0
-                    if event.key == pygame.K_UP:
-                        dy = -1
-                    elif event.key == pygame.K_DOWN:
-                        dy = 1
-                    elif event.key == pygame.K_LEFT:
-                        dx = -1
-                    elif event.key == pygame.K_RIGHT:
-                        dx = 1
-                    
-                    if dx != 0 or dy != 0:
-                        player.set_moving_direction(dx, dy)
-                        player.try_move(dx, dy, current_map_data["grid"], player.total_rows, player.total_cols, is_continuous=False)
-            
-            elif event.type == pygame.KEYUP:
-                if event.key in [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]:
-                    player.clear_moving_direction()
 
-
-
-        player.update(current_map_data["grid"])
+                    if interaction_happened:
+                        # The Up press was used for the door; walking up again needs a fresh press
+                        interaction_key_latched = True
+
+        # Movement follows the arrow key currently held down, sampled once per frame
+        keys = pygame.key.get_pressed()
+        if not keys[pygame.K_UP]:
+            interaction_key_latched = False
+
+        dx, dy = 0, 0
+        if keys[pygame.K_UP] and not interaction_key_latched:
+            dy = -1
+        elif keys[pygame.K_DOWN]:
+            dy = 1
+        elif keys[pygame.K_LEFT]:
+            dx = -1
+        elif keys[pygame.K_RIGHT]:
+            dx = 1
+
+        if dx == 0 and dy == 0:
+            if player.moving_direction:
+                player.clear_moving_direction()
+        elif player.moving_direction != (dx, dy):
+            # Newly pressed direction: step right away, holding it keeps walking via player.update
+            player.set_moving_direction(dx, dy)
+            player.try_move(dx, dy, is_continuous=False)
+
+        player.update()
         camera.update(player.rect)
 
-        screen.fill((114,199,160)) 
-
         #Drawing Logic
-        map_rows_to_draw, map_cols_to_draw = current_map_data["grid"].shape
-        start_col = max(0, camera.camera_x // TILE_SIZE)
-        end_col = min(map_cols_to_draw, (camera.camera_x + SCREEN_WIDTH) // TILE_SIZE + 1)
-        start_row = max(0, camera.camera_y // TILE_SIZE)
-        end_row = min(map_rows_to_draw, (camera.camera_y + SCREEN_HEIGHT) // TILE_SIZE + 1)
-
-        for row_idx in range(start_row, end_row):
-            for col_idx in range(start_col, end_col):
-                world_x, world_y = col_idx * TILE_SIZE, row_idx * TILE_SIZE
-                draw_x, draw_y = camera.apply_pixel_coords(world_x, world_y)
-                
-                tile_type = current_map_data["tiles"][row_idx][col_idx]
-
-                if tile_type in all_tile_textures:
-                    screen.blit(all_tile_textures[tile_type], (draw_x, draw_y))
-                else: 
-                    pygame.draw.rect(screen, (255, 0, 255), (draw_x, draw_y, TILE_SIZE, TILE_SIZE))
-
-
-        if current_map_data["type"] == "outdoor":
-            for building_obj in placed_buildings_data:
-                world_x, world_y = building_obj["grid_x"] * square_width, building_obj["grid_y"] * square_height
-                draw_x, draw_y = camera.apply_pixel_coords(world_x, world_y)
-                
-                building_pixel_width = building_obj["width_tiles"] * square_width
-                building_pixel_height = building_obj["height_tiles"] * square_height
-                
-                if (draw_x + building_pixel_width > 0 and draw_x < SCREEN_WIDTH and
-                    draw_y + building_pixel_height > 0 and draw_y < SCREEN_HEIGHT):
-                    
-                    building_sprite = building_images.get(building_obj["type"])
-                    if building_sprite:
-                        screen.blit(building_sprite, (draw_x, draw_y))
-                    else:
-                        pygame.draw.rect(screen, (255, 0, 255), (draw_x, draw_y,
-                                                                building_pixel_width,
-                                                                building_pixel_height))
-
-
-        screen.blit(player.image, camera.apply(player.rect))
-        
-        pygame.display.flip()
+        # Tiles and buildings never change while on a map, so they are composited once (chunk by chunk, as the camera
+        # reaches them) and afterwards only the part under the camera is copied to the screen
+        if "surface" not in current_map_data:
+            static_sprites = building_sprites if current_map_data["type"] == "outdoor" else ()
+            current_map_data["surface"] = ChunkedMapSurface(current_map_data["tiles"], tile_textures, TILE_SIZE,
+                                                              (SCREEN_WIDTH, SCREEN_HEIGHT), static_sprites)
+        map_surface = current_map_data["surface"]
+        player_draw_rect = camera.apply(player.rect)
+        view = (map_surface, camera.camera_x, camera.camera_y)
+
+        if view != last_view:
+            # Camera moved or the map changed: redraw the whole window
+            # The map covers the whole window unless it is smaller than the screen
+            if map_surface.get_width() < SCREEN_WIDTH or map_surface.get_height() < SCREEN_HEIGHT:
+                screen.fill(MAP_BACKGROUND_COLOR)
+
+            map_surface.blit_area(screen, (0, 0), pygame.Rect(camera.camera_x, camera.camera_y, SCREEN_WIDTH, SCREEN_HEIGHT))
+            screen.blit(player.image, player_draw_rect)
+            pygame.display.flip()
+        elif player_draw_rect != last_player_draw_rect or player.image is not last_player_image:
+            # Same view as last frame: only the player's old and new spots can have changed.
+            # The map surface already holds the buildings, so it alone restores the player's old spot
+            map_surface.blit_area(screen, last_player_draw_rect.topleft, last_player_draw_rect.move(camera.camera_x, camera.camera_y))
+            screen.blit(player.image, player_draw_rect)
+            pygame.display.update([last_player_draw_rect, player_draw_rect])
+        # Otherwise nothing on screen changed, so the display is left alone
+
+        last_view = view
+        last_player_draw_rect = player_draw_rect
+        last_player_image = player.image
         clock.tick(60)
 
     pygame.quit()
@@ -0,0 +1,255 @@
+# Map generation only needs numpy, so it can be imported (e.g. to search for seeds) without loading pygame/SDL
+import numpy as np
+import random
+from collections import deque
+
+
+# Supergrid zone codes, small ints so a zone fits in one byte
+class BiomeType:
+    PATH = 0
+    LAKE = 1
+    FOREST = 2
+    TALLGRASS = 3
+    FLOWERS = 4
+
+
+# Tile maps store these small integer ids instead of tile-name strings
+class TileType:
+    GRASSLAND = 0
+    WATER = 1
+    FOREST_TREE = 2
+    TALLGRASS = 3
+    FLOWERS = 4
+    WOOD_FLOOR = 5
+    STONE_WALL = 6
+    DOOR = 7
+
+# Config/texture name of every TileType id, in id order
+TILE_TYPE_NAMES = ("grassland", "water", "forest_tree", "tallgrass", "flowers", "wood_floor", "stone_wall", "door")
+TILE_TYPE_IDS = {name: tile_id for tile_id, name in enumerate(TILE_TYPE_NAMES)}
+
+# Base TileType of every BiomeType zone, indexed by zone code
+ZONE_TILE_TYPES = np.array([TileType.GRASSLAND, TileType.WATER, TileType.FOREST_TREE, TileType.TALLGRASS, TileType.FLOWERS], dtype=np.uint8)
+
+
+#Map Gen
+def generate_layered_map(rows, cols, map_settings, rng):
+    # Zone growth makes many single draws, which the stdlib generator serves faster than numpy,
+    # so a private one is seeded from rng and one seed still fixes the whole map.
+    # Its methods are bound to locals since the BFS below calls them per cell
+    zone_rng = random.Random(int(rng.integers(2**32)))
+    randint = zone_rng.randint
+    random_unit = zone_rng.random
+    shuffle = zone_rng.shuffle
+
+    SUPER_GRID_REGION_SIZE = map_settings["super_grid_region_size"]
+    max_path_percentage = map_settings["max_path_percentage"]
+    max_attempts = map_settings["max_map_generation_attempts"]
+    tallgrass_probability = map_settings["tallgrass_probability"]
+    flowers_probability = map_settings["flowers_probability"]
+
+    # Calculate supergrid dimensions
+    super_rows = rows // SUPER_GRID_REGION_SIZE
+    super_cols = cols // SUPER_GRID_REGION_SIZE
+
+    if super_rows == 0 or super_cols == 0:
+        print("Error: Map dimensions too small for super-grid size.")
+        return None, None
+
+    num_super_cells = super_rows * super_cols
+
+    # Initialize supergrid with paths by default
+    super_grid = np.full((super_rows, super_cols), BiomeType.PATH, dtype=np.int8)
+    zone_types = [BiomeType.LAKE, BiomeType.FOREST]
+    
+    attempts = 0
+
+    while attempts < max_attempts:
+        # Grown as a flat row-major bytearray (cell = r * super_cols + c): single byte stores
+        # are much cheaper than numpy scalar writes inside the loop below
+        current_super_grid = bytearray([BiomeType.PATH]) * num_super_cells
+        
+        # More zones for for nonpath areas
+        num_zones_to_create = randint(5, 12)
+        # Types for all of this attempt's zones in one draw
+        zone_type_choices = rng.choice(zone_types, size=num_zones_to_create).tolist()
+        for zone_type in zone_type_choices:
+            start_r = randint(0, super_rows - 1)
+            start_c = randint(0, super_cols - 1)
+            
+           
+            blob_size = randint(10, 35)
+
+            q = deque([start_r * super_cols + start_c])
+            visited = bytearray(num_super_cells) # Bitmap of cells already taken from the queue
+            count = 0
+
+            # Only in-bounds cells are ever queued, so no bounds check is needed here
+            while q and count < blob_size:
+                cell = q.popleft()
+
+                if visited[cell]:
+                    continue
+                visited[cell] = 1
+
+                current_super_grid[cell] = zone_type
+                count += 1
+
+                
+                if random_unit() < 0.8:
+                    r, c = divmod(cell, super_cols)
+                    neighbors = []
+                    if r > 0: neighbors.append(cell - super_cols)
+                    if r < super_rows - 1: neighbors.append(cell + super_cols)
+                    if c > 0: neighbors.append(cell - 1)
+                    if c < super_cols - 1: neighbors.append(cell + 1)
+                    shuffle(neighbors) 
+                    q.extend(neighbors)
+            
+        path_cells = current_super_grid.count(BiomeType.PATH)
+        current_path_percentage = path_cells / num_super_cells
+
+        # Check if the current path percentage is within the allowed limit
+        if current_path_percentage <= max_path_percentage:
+            super_grid = np.frombuffer(current_super_grid, dtype=np.int8).reshape(super_rows, super_cols)
+            break
+        attempts += 1
+    
+    if attempts == max_attempts:
+        print(f"Couldn't generate map with the current path percentage")
+    else:
+        print(f"Map generation successful after {attempts} attempts.")
+
+
+    # Translate supergrid to tile level coordinate grid
+    coordinate_grid = np.zeros((rows, cols), dtype=np.uint8)
+    # Any edge strip the supergrid doesn't cover (rows/cols not a multiple of the region size)
+    # stays impassable, so it is drawn as trees rather than as grass the player can't enter
+    tile_map = np.full((rows, cols), TileType.FOREST_TREE, dtype=np.uint8)
+
+    # Resolve walkability and base tile per zone on the small supergrid, then blow both up
+    # so every supergrid cell covers a SUPER_GRID_REGION_SIZE square of tiles
+    super_walkable = (super_grid == BiomeType.PATH).astype(np.uint8) #1 for walkable, 0 for impassable
+    super_tiles = ZONE_TILE_TYPES[super_grid]
+    covered_rows = super_rows * SUPER_GRID_REGION_SIZE
+    covered_cols = super_cols * SUPER_GRID_REGION_SIZE
+
+    coordinate_grid[:covered_rows, :covered_cols] = np.repeat(np.repeat(super_walkable, SUPER_GRID_REGION_SIZE, axis=0), SUPER_GRID_REGION_SIZE, axis=1)
+    tile_map[:covered_rows, :covered_cols] = np.repeat(np.repeat(super_tiles, SUPER_GRID_REGION_SIZE, axis=0), SUPER_GRID_REGION_SIZE, axis=1)
+
+
+    # Decorate walkable tiles: tallgrass first, flowers only where no tallgrass landed
+    tallgrass_rolls = rng.random((rows, cols), dtype=np.float32)
+    flowers_rolls = rng.random((rows, cols), dtype=np.float32)
+    walkable = coordinate_grid == 1
+    tallgrass_mask = walkable & (tallgrass_rolls < tallgrass_probability)
+    flowers_mask = walkable & ~tallgrass_mask & (flowers_rolls < flowers_probability)
+    tile_map[tallgrass_mask] = TileType.TALLGRASS
+    tile_map[flowers_mask] = TileType.FLOWERS
+
+
+    return coordinate_grid, tile_map
+
+
+def generate_interior_map(rows, cols, interior_settings):
+    coordinate_grid = np.zeros((rows, cols), dtype=np.uint8)
+    tile_map = np.empty((rows, cols), dtype=np.uint8)
+
+    floor_tile_type = TILE_TYPE_IDS[interior_settings["floor_tile_type"]]
+    wall_tile_type = TILE_TYPE_IDS[interior_settings["wall_tile_type"]]
+    door_tile_type = TILE_TYPE_IDS[interior_settings["door_tile_type"]]
+
+
+    tile_map.fill(floor_tile_type)
+    coordinate_grid.fill(1) 
+
+    # Create walls around the perimeter
+    for edge in (np.s_[0, :], np.s_[-1, :], np.s_[:, 0], np.s_[:, -1]):
+        tile_map[edge] = wall_tile_type
+        coordinate_grid[edge] = 0 #Walls are impassable
+
+    # Place a door in the middle of the bottom wall
+    door_col = cols // 2
+    #door is on the bottom wall and in bounds
+    if rows - 1 >= 0 and 0 <= door_col < cols:
+        tile_map[rows - 1, door_col] = door_tile_type
+        coordinate_grid[rows - 1, door_col] = 1 
+
+    print(f"Interior map generated: {rows}x{cols} with door at ({rows-1}, {door_col})")
+    return coordinate_grid, tile_map, (rows - 1, door_col)
+
+
+def find_clear_footprints(coordinate_grid, height, width):
+    """
+    Returns a boolean grid that is True at every top-left (r, c) where a height x width
+    block lies entirely on walkable tiles. A summed-area table makes each block an O(1) check.
+    """
+    rows, cols = coordinate_grid.shape
+    clear = np.zeros((rows, cols), dtype=bool)
+    if height > rows or width > cols:
+        return clear
+
+    # walkable_sums[r, c] = number of walkable tiles above and left of (r, c), with a zero border
+    walkable_sums = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+    walkable_sums[1:, 1:] = (coordinate_grid == 1).cumsum(axis=0).cumsum(axis=1)
+
+    block_sums = (walkable_sums[height:, width:] - walkable_sums[:-height, width:]
+                  - walkable_sums[height:, :-width] + walkable_sums[:-height, :-width])
+    clear[:rows - height + 1, :cols - width + 1] = block_sums == height * width
+    return clear
+
+
+def place_buildings_on_map(coordinate_grid, num_buildings, building_definitions, rng):
+    rows, cols = coordinate_grid.shape
+    placed_buildings_objects = []
+    clear_footprints = {} # (height, width) -> find_clear_footprints result, reset whenever a building is placed
+
+    # Collect all possible top-left starting points (must be a path tile), as plain (r, c) ints in random order
+    possible_top_lefts = np.argwhere(coordinate_grid == 1)
+    rng.shuffle(possible_top_lefts)
+    possible_top_lefts = possible_top_lefts.tolist()
+
+    building_types = list(building_definitions.keys())
+    # Building type to try at every candidate, drawn in one batch
+    type_choices = rng.integers(0, len(building_types), size=len(possible_top_lefts)).tolist()
+
+    for (r_start, c_start), type_idx in zip(possible_top_lefts, type_choices):
+        if len(placed_buildings_objects) >= num_buildings:
+            break 
+
+        building_type_name = building_types[type_idx]
+        building_info = building_definitions[building_type_name]
+        
+        b_width = building_info["width_tiles"]
+        b_height = building_info["height_tiles"]
+        
+        # The tile below the building's middle becomes its entrance and must be walkable.
+        # A single tile is the cheapest test, so failing candidates are dropped before the footprint check
+        interaction_tile_x = c_start + b_width // 2
+        interaction_tile_y = r_start + b_height 
+        if interaction_tile_y >= rows or interaction_tile_x >= cols or coordinate_grid[interaction_tile_y, interaction_tile_x] != 1:
+            continue
+
+        # Building must fit within map boundaries and can only be placed on path tiles
+        footprint_size = (b_height, b_width)
+        if footprint_size not in clear_footprints:
+            clear_footprints[footprint_size] = find_clear_footprints(coordinate_grid, b_height, b_width)
+        if not clear_footprints[footprint_size][r_start, c_start]:
+            continue
+
+        # Mark the tiles occupied by the building as impassable (2)
+        coordinate_grid[r_start:r_start + b_height, c_start:c_start + b_width] = 2
+        
+        coordinate_grid[interaction_tile_y, interaction_tile_x] = 1 
+        clear_footprints.clear()
+
+        placed_buildings_objects.append({
+            "type": building_type_name,
+            "grid_x": c_start,
+            "grid_y": r_start,
+            "width_tiles": b_width,
+            "height_tiles": b_height,
+            "entrance_tile_world_coords": (interaction_tile_x, interaction_tile_y) #The player stands on this tile to interact
+        })
+            
+    return placed_buildings_objects
@@ -1,3 +1,4 @@
+import numpy as np
 import pygame
 import sys
 
@@ -24,39 +25,46 @@ maze_layout = [
     "0101010101010101010101010101",
 ]
 
-maze = [list(row) for row in maze_layout]
+# Cell codes (0 or 1) as a ROWS x COLS byte grid
+maze = np.frombuffer("".join(maze_layout).encode(), np.uint8).reshape(len(maze_layout), -1) - ord("0")
 
-ROWS = len(maze)
-COLS = len(maze[0])
+ROWS, COLS = maze.shape
 
 WIDTH, HEIGHT = COLS * TILE_SIZE, ROWS * TILE_SIZE
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Random Pokémon Map")
-clock = pygame.time.Clock()
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
+# RGB colour of each cell code
+MAZE_COLORS = np.array([WHITE, BLACK], np.uint8)
 
-def draw_maze():
-    for y, row in enumerate(maze):
-        for x, tile in enumerate(row):
-            rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            if tile == '1':
-                pygame.draw.rect(screen, BLACK, rect)
-            elif tile == '0':
-                pygame.draw.rect(screen, WHITE, rect)
+def render_maze():
+    """
+    Draws the maze once onto its own surface. It never changes, so the loop below only blits it.
+    """
+    # Colour every cell, scale the cells up to tiles, and write all pixels in one go
+    cell_pixels = MAZE_COLORS[maze]
+    pixels = np.repeat(np.repeat(cell_pixels, TILE_SIZE, axis=0), TILE_SIZE, axis=1)
 
-running = True
-while running:
-    screen.fill(BLACK)
-    draw_maze()
-    pygame.display.flip()
+    maze_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+    pygame.surfarray.blit_array(maze_surface, pixels.swapaxes(0, 1)) # surfarray is indexed [x, y]
+    return maze_surface
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+maze_surface = render_maze()
 
-    clock.tick(60)
+running = True
+screen.blit(maze_surface, (0, 0))
+pygame.display.flip()
+
+# Nothing on screen changes by itself, so sleep until an event arrives
+while running:
+    event = pygame.event.wait()
+    if event.type == pygame.QUIT:
+        running = False
+    elif event.type == pygame.WINDOWEXPOSED:
+        # The window was uncovered and may need its contents shown again
+        pygame.display.flip()
 
 pygame.quit()
 sys.exit()
\ No newline at end of file